@@ -5,12 +5,12 @@ import subprocess
 import shutil
 import tempfile
 import os
-from typing import List, Set
+from typing import Iterable, List, Set
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import dns.resolver
 from stream_output import stream_print
 from config import DEFAULT_THREADS, DNS_TIMEOUT, DNS_RESOLVERS
-from utils import load_wordlist, is_dnsx_available
+from utils import iter_wordlist, is_dnsx_available
 
 
 def resolve_dns_python(subdomain: str, timeout: int = DNS_TIMEOUT) -> bool:
@@ -93,18 +93,14 @@ def resolve_with_python(candidates: List[str], threads: int = DEFAULT_THREADS) -
     return resolved
 
 
-def generate_candidates(domain: str, wordlist: List[str]) -> List[str]:
+def generate_candidates(domain: str, wordlist: Iterable[str]) -> List[str]:
     """Generate candidate subdomains from wordlist"""
-    candidates = []
+    candidates = set()
     for word in wordlist:
         word = word.strip().lower()
         if word and not word.startswith('#'):
-            # Handle words with and without dots
-            if '.' in word:
-                candidates.append(f"{word}.{domain}")
-            else:
-                candidates.append(f"{word}.{domain}")
-    return list(set(candidates))  # Remove duplicates
+            candidates.add(f"{word}.{domain}")
+    return list(candidates)
 
 
 def active_enum(domain: str, wordlist_path: str, threads: int = DEFAULT_THREADS, use_dnsx: bool = True) -> List[str]:
@@ -122,16 +118,12 @@ def active_enum(domain: str, wordlist_path: str, threads: int = DEFAULT_THREADS,
     """
     stream_print(f"[*] Starting active enumeration for {domain}", "info")
     
-    # Load wordlist
-    wordlist = load_wordlist(wordlist_path)
-    if not wordlist:
+    # Stream the wordlist straight into deduplicated candidates
+    candidates = generate_candidates(domain, iter_wordlist(wordlist_path))
+    if not candidates:
         stream_print("[!] Empty or invalid wordlist", "error")
         return []
     
-    stream_print(f"[*] Loaded {len(wordlist)} words from wordlist", "info")
-    
-    # Generate candidates
-    candidates = generate_candidates(domain, wordlist)
     stream_print(f"[*] Generated {len(candidates)} candidate subdomains", "info")
     
     resolved = set()
@@ -236,7 +236,8 @@ async def run_scan_task(scan_id: str, request: ScanRequest):
             )
             
             to_fingerprint = all_subdomains[:50]
-            fingerprint_results = fingerprint_subdomains(to_fingerprint, threads=10)
+            # Blocking network scan: run off the event loop so WebSocket updates keep flowing
+            fingerprint_results = await asyncio.to_thread(fingerprint_subdomains, to_fingerprint, threads=10)
             scan_data['technologies'] = {}
             scan_data['http_status'] = {}
             
@@ -256,7 +257,7 @@ async def run_scan_task(scan_id: str, request: ScanRequest):
             )
             
             to_enrich = all_subdomains[:30]
-            threat_results = enrich_subdomains(to_enrich, threads=5)
+            threat_results = await asyncio.to_thread(enrich_subdomains, to_enrich, threads=5)
             scan_data['threat_scores'] = {}
             
             for result in threat_results:
@@ -270,7 +271,7 @@ async def run_scan_task(scan_id: str, request: ScanRequest):
                 {"$set": {"progress": 90, "current_step": "takeover detection"}}
             )
             
-            takeover_results = scan_takeover(all_subdomains, threads=10)
+            takeover_results = await asyncio.to_thread(scan_takeover, all_subdomains, threads=10)
             scan_data['takeover_vulnerable'] = {}
             scan_data['cnames'] = {}
             
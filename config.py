@@ -30,6 +30,12 @@ DEFAULT_THREADS = 50
 DNS_TIMEOUT = 3
 REQUEST_TIMEOUT = 10
 
+# Cache settings (seconds)
+DNS_CACHE_TTL = 300             # Upper bound for positive answers (record TTL is used when lower)
+DNS_NEGATIVE_CACHE_TTL = 3600   # NXDOMAIN / no A record
+DNS_MAX_STALE = 60              # Serve expired answers this long while refreshing in background
+THREAT_CACHE_TTL = 86400        # Successful VirusTotal / Shodan lookups
+
 # Passive sources
 PASSIVE_SOURCES = {
     "crtsh": True,
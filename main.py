@@ -17,7 +17,7 @@ from takeover_detect import scan_takeover
 from report_generator import generate_reports
 from utils import (
     is_valid_domain, sanitize_domain, deduplicate_subdomains,
-    save_to_file, format_timestamp, resolve_ips
+    save_to_file, format_timestamp, resolve_ips_many
 )
 from config import HISTORY_DIR, WORDLISTS_DIR
 
@@ -260,10 +260,9 @@ Examples:
     
     # Resolve IPs for all subdomains (for reports)
     stream_print(f"\n[*] Resolving IP addresses...", "info")
-    for sub in all_subdomains[:100]:  # Limit to first 100
-        ips = resolve_ips(sub)
-        if ips:
-            scan_data['ips'][sub] = ', '.join(ips)
+    resolved = resolve_ips_many(all_subdomains[:100], threads=args.threads)  # Limit to first 100
+    for sub, ips in resolved.items():
+        scan_data['ips'][sub] = ', '.join(ips)
     
     # ========== SAVE RESULTS ==========
     if not args.no_save:
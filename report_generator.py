@@ -4,6 +4,7 @@ Report generation in multiple formats (HTML, JSON, CSV, PDF)
 import json
 import csv
 from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from jinja2 import Environment, FileSystemLoader
@@ -17,8 +18,53 @@ from stream_output import stream_print
 from config import REPORTS_DIR, TEMPLATES_DIR
 from utils import format_display_time
 
+# Large write buffer so streamed report rows are flushed in few syscalls
+_WRITE_BUFFER_SIZE = 1 << 20
 
-def generate_html_report(domain: str, scan_data: Dict, output_path: str = None) -> str:
+# Rows per subdomain table in PDF reports
+_PDF_TABLE_CHUNK = 500
+
+_SUBDOMAIN_COL_WIDTHS = (0.5*inch, 3*inch, 1.5*inch, 1*inch)
+
+_SUBDOMAIN_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('FONTSIZE', (0, 1), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey])
+])
+
+# Per-subdomain fields of scan_data, each a dict keyed by subdomain
+_SUBDOMAIN_FIELDS = (
+    'ips', 'cnames', 'sources', 'http_status',
+    'technologies', 'threat_scores', 'takeover_vulnerable'
+)
+
+
+def _to_columns(scan_data: Dict) -> Dict[str, List]:
+    """
+    Convert scan_data into column lists aligned with scan_data['subdomains']
+    
+    Generators zip over these columns instead of hashing every subdomain
+    into each per-field dict again for every row. Missing values are None.
+    """
+    subdomains = scan_data.get('subdomains', [])
+    columns = {'subdomains': subdomains}
+    
+    for field in _SUBDOMAIN_FIELDS:
+        values = scan_data.get(field) or {}
+        columns[field] = [values.get(sub) for sub in subdomains]
+    
+    return columns
+
+
+def generate_html_report(domain: str, scan_data: Dict, output_path: str = None,
+                         columns: Dict[str, List] = None) -> str:
     """
     Generate HTML report using Jinja2 template
     
@@ -31,13 +77,11 @@ def generate_html_report(domain: str, scan_data: Dict, output_path: str = None)
         template = env.get_template('report_template.html')
         
         # Prepare data for template
-        results = []
-        for sub in scan_data.get('subdomains', []):
-            results.append({
-                'subdomain': sub,
-                'ip': scan_data.get('ips', {}).get(sub, '-'),
-                'source': scan_data.get('sources', {}).get(sub, '-')
-            })
+        columns = columns or _to_columns(scan_data)
+        results = [
+            {'subdomain': sub, 'ip': ip or '-', 'source': source or '-'}
+            for sub, ip, source in zip(columns['subdomains'], columns['ips'], columns['sources'])
+        ]
         
         meta = {
             'scan_date': format_display_time(scan_data.get('timestamp')),
@@ -57,8 +101,7 @@ def generate_html_report(domain: str, scan_data: Dict, output_path: str = None)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_path = REPORTS_DIR / f"{domain}_report_{timestamp}.html"
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        Path(output_path).write_text(html_content, encoding='utf-8')
         
         stream_print(f"[✓] HTML report saved: {output_path}", "success")
         return str(output_path)
@@ -68,7 +111,34 @@ def generate_html_report(domain: str, scan_data: Dict, output_path: str = None)
         return None
 
 
-def generate_json_report(domain: str, scan_data: Dict, output_path: str = None) -> str:
+def _json_subdomain_records(columns: Dict[str, List]) -> List[Dict]:
+    """
+    Build the per-subdomain JSON records from aligned columns
+    
+    Specialized on the fixed report schema: one literal dict per row built
+    from zipped locals, with no per-field lookups into scan_data.
+    """
+    return [
+        {
+            'subdomain': sub,
+            'ip': ip,
+            'cname': cname,
+            'source': source,
+            'http_status': http_status,
+            'technologies': technologies,
+            'threat_score': threat_score,
+            'takeover_vulnerable': takeover_vulnerable
+        }
+        for sub, ip, cname, source, http_status, technologies, threat_score, takeover_vulnerable in zip(
+            columns['subdomains'], columns['ips'], columns['cnames'], columns['sources'],
+            columns['http_status'], columns['technologies'], columns['threat_scores'],
+            columns['takeover_vulnerable']
+        )
+    ]
+
+
+def generate_json_report(domain: str, scan_data: Dict, output_path: str = None,
+                         columns: Dict[str, List] = None) -> str:
     """
     Generate JSON report
     
@@ -76,27 +146,16 @@ def generate_json_report(domain: str, scan_data: Dict, output_path: str = None)
         Path to generated report
     """
     try:
+        columns = columns or _to_columns(scan_data)
         report_data = {
             'domain': domain,
             'scan_date': format_display_time(scan_data.get('timestamp')),
             'mode': scan_data.get('mode', 'mixed'),
-            'total_subdomains': len(scan_data.get('subdomains', [])),
-            'subdomains': []
+            'total_subdomains': len(columns['subdomains'])
         }
         
         # Add subdomain details
-        for sub in scan_data.get('subdomains', []):
-            subdomain_data = {
-                'subdomain': sub,
-                'ip': scan_data.get('ips', {}).get(sub),
-                'cname': scan_data.get('cnames', {}).get(sub),
-                'source': scan_data.get('sources', {}).get(sub),
-                'http_status': scan_data.get('http_status', {}).get(sub),
-                'technologies': scan_data.get('technologies', {}).get(sub),
-                'threat_score': scan_data.get('threat_scores', {}).get(sub),
-                'takeover_vulnerable': scan_data.get('takeover_vulnerable', {}).get(sub)
-            }
-            report_data['subdomains'].append(subdomain_data)
+        report_data['subdomains'] = _json_subdomain_records(columns)
         
         # Add summary statistics
         report_data['statistics'] = {
@@ -112,8 +171,10 @@ def generate_json_report(domain: str, scan_data: Dict, output_path: str = None)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_path = REPORTS_DIR / f"{domain}_report_{timestamp}.json"
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report_data, f, indent=2, ensure_ascii=False)
+        Path(output_path).write_text(
+            json.dumps(report_data, indent=2, ensure_ascii=False),
+            encoding='utf-8'
+        )
         
         stream_print(f"[✓] JSON report saved: {output_path}", "success")
         return str(output_path)
@@ -123,7 +184,8 @@ def generate_json_report(domain: str, scan_data: Dict, output_path: str = None)
         return None
 
 
-def generate_csv_report(domain: str, scan_data: Dict, output_path: str = None) -> str:
+def generate_csv_report(domain: str, scan_data: Dict, output_path: str = None,
+                        columns: Dict[str, List] = None) -> str:
     """
     Generate CSV report
     
@@ -135,22 +197,24 @@ def generate_csv_report(domain: str, scan_data: Dict, output_path: str = None) -
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_path = REPORTS_DIR / f"{domain}_report_{timestamp}.csv"
         
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        columns = columns or _to_columns(scan_data)
+        
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
             fieldnames = ['subdomain', 'ip', 'cname', 'http_status', 'source', 'threat_score', 'takeover_vulnerable']
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer = csv.writer(f)
             
-            writer.writeheader()
+            writer.writerow(fieldnames)
             
-            for sub in scan_data.get('subdomains', []):
-                writer.writerow({
-                    'subdomain': sub,
-                    'ip': scan_data.get('ips', {}).get(sub, ''),
-                    'cname': scan_data.get('cnames', {}).get(sub, ''),
-                    'http_status': scan_data.get('http_status', {}).get(sub, ''),
-                    'source': scan_data.get('sources', {}).get(sub, ''),
-                    'threat_score': scan_data.get('threat_scores', {}).get(sub, ''),
-                    'takeover_vulnerable': scan_data.get('takeover_vulnerable', {}).get(sub, '')
-                })
+            # Aligned columns + writerows keep the per-row work in C (None is written as '')
+            writer.writerows(zip(
+                columns['subdomains'],
+                columns['ips'],
+                columns['cnames'],
+                columns['http_status'],
+                columns['sources'],
+                columns['threat_scores'],
+                columns['takeover_vulnerable']
+            ))
         
         stream_print(f"[✓] CSV report saved: {output_path}", "success")
         return str(output_path)
@@ -160,7 +224,34 @@ def generate_csv_report(domain: str, scan_data: Dict, output_path: str = None) -
         return None
 
 
-def generate_pdf_report(domain: str, scan_data: Dict, output_path: str = None) -> str:
+def _subdomain_table_chunks(columns: Dict[str, List]):
+    """
+    Yield the subdomain listing as fixed-size PDF tables
+    
+    Small tables let ReportLab lay out and release each chunk page by page
+    instead of splitting one table that holds every subdomain.
+    """
+    subdomains = columns['subdomains']
+    ips = columns['ips']
+    http_status = columns['http_status']
+    
+    for start in range(0, len(subdomains), _PDF_TABLE_CHUNK):
+        end = start + _PDF_TABLE_CHUNK
+        table_data = [['#', 'Subdomain', 'IP', 'Status']]
+        table_data += [
+            [str(i), sub, (ip or '-')[:15], '-' if status is None else str(status)]  # Truncate long IPs
+            for i, sub, ip, status in zip(
+                range(start + 1, end + 1), subdomains[start:end], ips[start:end], http_status[start:end]
+            )
+        ]
+        
+        sub_table = Table(table_data, colWidths=_SUBDOMAIN_COL_WIDTHS, repeatRows=1)
+        sub_table.setStyle(_SUBDOMAIN_TABLE_STYLE)
+        yield sub_table
+
+
+def generate_pdf_report(domain: str, scan_data: Dict, output_path: str = None,
+                        columns: Dict[str, List] = None) -> str:
     """
     Generate PDF report
     
@@ -172,6 +263,8 @@ def generate_pdf_report(domain: str, scan_data: Dict, output_path: str = None) -
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_path = REPORTS_DIR / f"{domain}_report_{timestamp}.pdf"
         
+        columns = columns or _to_columns(scan_data)
+        total_subdomains = len(columns['subdomains'])
         doc = SimpleDocTemplate(str(output_path), pagesize=A4)
         story = []
         styles = getSampleStyleSheet()
@@ -193,7 +286,7 @@ def generate_pdf_report(domain: str, scan_data: Dict, output_path: str = None) -
         story.append(Paragraph(f"<b>Target Domain:</b> {domain}", meta_style))
         story.append(Paragraph(f"<b>Scan Date:</b> {format_display_time(scan_data.get('timestamp'))}", meta_style))
         story.append(Paragraph(f"<b>Mode:</b> {scan_data.get('mode', 'mixed')}", meta_style))
-        story.append(Paragraph(f"<b>Total Subdomains:</b> {len(scan_data.get('subdomains', []))}", meta_style))
+        story.append(Paragraph(f"<b>Total Subdomains:</b> {total_subdomains}", meta_style))
         story.append(Spacer(1, 0.3*inch))
         
         # Summary statistics
@@ -221,38 +314,9 @@ def generate_pdf_report(domain: str, scan_data: Dict, output_path: str = None) -
         story.append(stats_table)
         story.append(Spacer(1, 0.3*inch))
         
-        # Subdomains table (first 50)
-        story.append(Paragraph("<b>Discovered Subdomains (first 50)</b>", styles['Heading2']))
-        
-        table_data = [['#', 'Subdomain', 'IP', 'Status']]
-        subdomains = scan_data.get('subdomains', [])[:50]
-        
-        for i, sub in enumerate(subdomains, 1):
-            table_data.append([
-                str(i),
-                sub,
-                scan_data.get('ips', {}).get(sub, '-')[:15],  # Truncate long IPs
-                str(scan_data.get('http_status', {}).get(sub, '-'))
-            ])
-        
-        sub_table = Table(table_data, colWidths=[0.5*inch, 3*inch, 1.5*inch, 1*inch])
-        sub_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('FONTSIZE', (0, 1), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey])
-        ]))
-        story.append(sub_table)
-        
-        if len(scan_data.get('subdomains', [])) > 50:
-            story.append(Spacer(1, 0.2*inch))
-            story.append(Paragraph(f"<i>... and {len(scan_data.get('subdomains', [])) - 50} more subdomains</i>", styles['Normal']))
+        # Subdomains tables, one flowable per chunk
+        story.append(Paragraph("<b>Discovered Subdomains</b>", styles['Heading2']))
+        story.extend(_subdomain_table_chunks(columns))
         
         # Build PDF
         doc.build(story)
@@ -265,6 +329,14 @@ def generate_pdf_report(domain: str, scan_data: Dict, output_path: str = None) -
         return None
 
 
+_REPORT_GENERATORS = {
+    'html': generate_html_report,
+    'json': generate_json_report,
+    'csv': generate_csv_report,
+    'pdf': generate_pdf_report,
+}
+
+
 def generate_reports(domain: str, scan_data: Dict, formats: List[str] = None) -> Dict[str, str]:
     """
     Generate reports in multiple formats
@@ -281,24 +353,25 @@ def generate_reports(domain: str, scan_data: Dict, formats: List[str] = None) ->
         formats = ['html', 'json', 'csv', 'pdf']
     
     reports = {}
+    formats = [f for f in formats if f in _REPORT_GENERATORS]
     
-    for format_type in formats:
-        if format_type == 'html':
-            path = generate_html_report(domain, scan_data)
-            if path:
-                reports['html'] = path
-        elif format_type == 'json':
-            path = generate_json_report(domain, scan_data)
-            if path:
-                reports['json'] = path
-        elif format_type == 'csv':
-            path = generate_csv_report(domain, scan_data)
-            if path:
-                reports['csv'] = path
-        elif format_type == 'pdf':
-            path = generate_pdf_report(domain, scan_data)
+    if not formats:
+        return reports
+    
+    # Build the column view once and share it between all generators
+    columns = _to_columns(scan_data)
+    
+    # Each generator is dominated by file I/O or C extensions, so run them concurrently
+    with ThreadPoolExecutor(max_workers=len(formats)) as executor:
+        futures = {
+            format_type: executor.submit(_REPORT_GENERATORS[format_type], domain, scan_data, columns=columns)
+            for format_type in formats
+        }
+        
+        for format_type, future in futures.items():
+            path = future.result()
             if path:
-                reports['pdf'] = path
+                reports[format_type] = path
     
     return reports
 
@@ -22,20 +22,85 @@
 
 #----------------------3---------------------#
 
+import sys
+import threading
+import time
 from colorama import Fore, Style, init
 
 # Initialize colorama for cross-platform support
 init(autoreset=True)
 
+# ANSI prefixes per color name, resolved once instead of per call
+_COLOR_PREFIXES = {
+    "info": Fore.YELLOW,
+    "success": Fore.GREEN,
+    "error": Fore.RED,
+    "highlight": Fore.CYAN
+}
+_RESET = Style.RESET_ALL
+
+def _format_line(text, color=None):
+    """Build one output line, colored if the color name is known."""
+    prefix = _COLOR_PREFIXES.get(color)
+    if prefix:
+        return prefix + text + _RESET + "\n"
+    return text + "\n"
+
 def stream_print(text, color=None):
     """Instant printing with optional color."""
-    colors = {
-        "info": Fore.YELLOW,
-        "success": Fore.GREEN,
-        "error": Fore.RED,
-        "highlight": Fore.CYAN
-    }
-    if color in colors:
-        print(colors[color] + text + Style.RESET_ALL)
-    else:
-        print(text)
+    # Single write per line (print() issues separate writes for text and newline)
+    sys.stdout.write(_format_line(text, color))
+
+
+class ProgressBatcher:
+    """
+    Buffer progress lines and write them to stdout in batches.
+
+    Pending lines are written with a single write + flush once max_lines
+    are queued or interval seconds have passed since the last write, and
+    when the batcher is closed (use it as a context manager). A timer
+    writes lines that are still pending when the interval runs out, so a
+    slow producer never holds back the last line.
+    """
+
+    def __init__(self, interval=0.1, max_lines=50):
+        self.interval = interval
+        self.max_lines = max_lines
+        self._lines = []
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._timer = None
+
+    def add(self, text, color=None):
+        """Queue a line for the next batch."""
+        line = _format_line(text, color)
+        with self._lock:
+            self._lines.append(line)
+            if len(self._lines) >= self.max_lines or time.monotonic() - self._last_flush >= self.interval:
+                self._flush_locked()
+            elif self._timer is None:
+                delay = self.interval - (time.monotonic() - self._last_flush)
+                self._timer = threading.Timer(delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        """Write all pending lines now."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._lines:
+            sys.stdout.write("".join(self._lines))
+            sys.stdout.flush()
+            self._lines.clear()
+        self._last_flush = time.monotonic()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
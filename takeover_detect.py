@@ -1,12 +1,13 @@
 """
 Subdomain takeover detection
 """
+import re
 import requests
 from typing import Dict, List, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from stream_output import stream_print
+from stream_output import ProgressBatcher, stream_print
 from config import REQUEST_TIMEOUT
-from utils import get_cname, resolve_ip
+from utils import get_cname, get_http_session, lookup_ips
 
 
 # Subdomain takeover fingerprints
@@ -85,6 +86,20 @@ TAKEOVER_FINGERPRINTS = {
     },
 }
 
+# Compiled matchers: one scan per CNAME/response regardless of fingerprint count
+_CNAME_SERVICES = {
+    pattern.lower(): service
+    for service, fingerprint in TAKEOVER_FINGERPRINTS.items()
+    for pattern in fingerprint['cname']
+}
+_CNAME_REGEX = re.compile(
+    '|'.join(re.escape(p) for p in sorted(_CNAME_SERVICES, key=len, reverse=True))
+)
+_RESPONSE_REGEXES = {
+    service: re.compile('|'.join(re.escape(p) for p in fingerprint['response']), re.IGNORECASE)
+    for service, fingerprint in TAKEOVER_FINGERPRINTS.items()
+}
+
 
 def check_cname_vulnerable(cname: str) -> Optional[str]:
     """
@@ -96,14 +111,8 @@ def check_cname_vulnerable(cname: str) -> Optional[str]:
     if not cname:
         return None
     
-    cname = cname.lower()
-    
-    for service, fingerprint in TAKEOVER_FINGERPRINTS.items():
-        for pattern in fingerprint['cname']:
-            if pattern in cname:
-                return service
-    
-    return None
+    match = _CNAME_REGEX.search(cname.lower())
+    return _CNAME_SERVICES[match.group(0)] if match else None
 
 
 def check_response_vulnerable(content: str, service: str) -> bool:
@@ -116,14 +125,8 @@ def check_response_vulnerable(content: str, service: str) -> bool:
     if not content or not service:
         return False
     
-    content = content.lower()
-    fingerprint = TAKEOVER_FINGERPRINTS.get(service, {})
-    
-    for pattern in fingerprint.get('response', []):
-        if pattern.lower() in content:
-            return True
-    
-    return False
+    regex = _RESPONSE_REGEXES.get(service)
+    return bool(regex and regex.search(content))
 
 
 def check_subdomain_takeover(subdomain: str) -> Dict:
@@ -144,12 +147,14 @@ def check_subdomain_takeover(subdomain: str) -> Dict:
         'evidence': []
     }
     
-    # Resolve IP and CNAME
-    result['ip'] = resolve_ip(subdomain)
+    # Resolve CNAME first: without one there is nothing to take over,
+    # so the A lookup is skipped for the (common) non-CNAME case
     result['cname'] = get_cname(subdomain)
     
     # Check CNAME
     if result['cname']:
+        ips = lookup_ips(subdomain)
+        result['ip'] = ips[0] if ips else None
         service = check_cname_vulnerable(result['cname'])
         if service:
             result['service'] = service
@@ -161,7 +166,7 @@ def check_subdomain_takeover(subdomain: str) -> Dict:
                 for protocol in ['https', 'http']:
                     try:
                         url = f"{protocol}://{subdomain}"
-                        response = requests.get(
+                        response = get_http_session().get(
                             url,
                             timeout=REQUEST_TIMEOUT,
                             allow_redirects=True,
@@ -193,11 +198,12 @@ def check_subdomain_takeover(subdomain: str) -> Dict:
             
             except Exception as e:
                 result['evidence'].append(f"Connection error: {str(e)}")
-    
-    # No IP resolved but has CNAME
-    elif result['cname'] and not result['ip']:
-        result['evidence'].append("CNAME exists but doesn't resolve to IP")
-        result['confidence'] = 'medium'
+        
+        # CNAME target does not resolve (a failed lookup is not evidence)
+        elif ips == []:
+            result['service'] = 'Dangling CNAME'
+            result['evidence'].append(f"CNAME exists but doesn't resolve to IP: {result['cname']}")
+            result['confidence'] = 'medium'
     
     return result
 
@@ -218,7 +224,8 @@ def scan_takeover(subdomains: List[str], threads: int = 10) -> List[Dict]:
     results = []
     vulnerable_count = 0
     
-    with ThreadPoolExecutor(max_workers=threads) as executor:
+    # Progress/suspicious lines are batched; vulnerabilities and errors print immediately
+    with ThreadPoolExecutor(max_workers=threads) as executor, ProgressBatcher() as progress:
         future_to_sub = {
             executor.submit(check_subdomain_takeover, sub): sub 
             for sub in subdomains
@@ -233,21 +240,23 @@ def scan_takeover(subdomains: List[str], threads: int = 10) -> List[Dict]:
                 
                 if result['vulnerable']:
                     vulnerable_count += 1
+                    progress.flush()
                     stream_print(
                         f"  [!] VULNERABLE: {subdomain} -> {result['service']} ({result['confidence']} confidence)",
                         "error"
                     )
                 elif result['confidence'] != 'none':
-                    stream_print(
+                    progress.add(
                         f"  [~] Suspicious: {subdomain} -> {result['service']} ({result['confidence']} confidence)",
                         "warning"
                     )
                 
                 completed += 1
                 if completed % 10 == 0:
-                    stream_print(f"[*] Progress: {completed}/{len(subdomains)}", "info")
+                    progress.add(f"[*] Progress: {completed}/{len(subdomains)}", "info")
             
             except Exception as e:
+                progress.flush()
                 stream_print(f"[!] Error scanning {subdomain}: {e}", "error")
     
     stream_print(f"[✓] Takeover scan complete: {vulnerable_count} vulnerable subdomains found", "success")
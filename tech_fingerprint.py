@@ -1,97 +1,84 @@
 """
 Technology fingerprinting - Identify tech stack on subdomains
 """
-import requests
+import re
+import threading
 from typing import Dict, List, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
-import builtwith
 from Wappalyzer import Wappalyzer, WebPage
-from stream_output import stream_print
+from stream_output import ProgressBatcher, stream_print
 from config import REQUEST_TIMEOUT
+from utils import get_http_session
 
 
-def fingerprint_with_wappalyzer(url: str) -> Dict:
+# Wappalyzer instance, loaded once on first use
+_wappalyzer = None
+_wappalyzer_lock = threading.Lock()
+
+# CMS/Framework name -> substrings that identify it in page content
+CMS_RULES = [
+    ('WordPress', ('wp-content', 'wp-includes')),
+    ('Joomla', ('joomla', '/components/com_')),
+    ('Drupal', ('drupal', 'sites/all/modules')),
+    ('Laravel', ('laravel', 'csrf-token')),
+    ('Django', ('csrfmiddlewaretoken',)),
+    ('React', ('react', '__react')),
+    ('Vue.js', ('vue', 'v-app')),
+    ('Angular', ('ng-app', 'angular')),
+]
+
+# Single alternation so page content is scanned once for every rule
+_CMS_PATTERN_NAMES = {pattern: cms for cms, patterns in CMS_RULES for pattern in patterns}
+_CMS_REGEX = re.compile(
+    '|'.join(re.escape(p) for p in sorted(_CMS_PATTERN_NAMES, key=len, reverse=True))
+)
+
+
+def _get_wappalyzer() -> Wappalyzer:
+    """Get the shared Wappalyzer instance (technology DB is parsed only once)"""
+    global _wappalyzer
+    if _wappalyzer is None:
+        with _wappalyzer_lock:
+            if _wappalyzer is None:
+                _wappalyzer = Wappalyzer.latest()
+    return _wappalyzer
+
+
+def fingerprint_with_wappalyzer(response) -> Dict:
     """
     Use Wappalyzer to detect technologies
     
+    Args:
+        response: Already fetched requests.Response for the page
+    
     Returns:
         Dictionary of detected technologies
     """
     try:
-        wappalyzer = Wappalyzer.latest()
-        webpage = WebPage.new_from_url(url, timeout=REQUEST_TIMEOUT)
+        wappalyzer = _get_wappalyzer()
+        webpage = WebPage.new_from_response(response)
         technologies = wappalyzer.analyze(webpage)
         return {'technologies': list(technologies), 'success': True}
     except Exception as e:
         return {'technologies': [], 'success': False, 'error': str(e)}
 
 
-def fingerprint_with_builtwith(url: str) -> Dict:
-    """
-    Use BuiltWith to detect technologies
-    
-    Returns:
-        Dictionary of detected technologies
-    """
-    try:
-        technologies = builtwith.parse(url)
-        return {'technologies': technologies, 'success': True}
-    except Exception as e:
-        return {'technologies': {}, 'success': False, 'error': str(e)}
-
-
 def detect_webserver(url: str) -> Optional[str]:
     """Detect web server from HTTP headers"""
     try:
-        response = requests.head(url, timeout=REQUEST_TIMEOUT, allow_redirects=True, verify=False)
+        response = get_http_session().head(url, timeout=REQUEST_TIMEOUT, allow_redirects=True, verify=False)
         return response.headers.get('Server', 'Unknown')
     except Exception:
         return None
 
 
-def detect_cms(url: str) -> List[str]:
-    """Detect CMS/Framework from common patterns"""
-    cms_patterns = []
-    try:
-        response = requests.get(url, timeout=REQUEST_TIMEOUT, allow_redirects=True, verify=False)
-        content = response.text.lower()
-        
-        # WordPress
-        if 'wp-content' in content or 'wp-includes' in content:
-            cms_patterns.append('WordPress')
-        
-        # Joomla
-        if 'joomla' in content or '/components/com_' in content:
-            cms_patterns.append('Joomla')
-        
-        # Drupal
-        if 'drupal' in content or 'sites/all/modules' in content:
-            cms_patterns.append('Drupal')
-        
-        # Laravel
-        if 'laravel' in content or 'csrf-token' in content:
-            cms_patterns.append('Laravel')
-        
-        # Django
-        if 'csrfmiddlewaretoken' in content:
-            cms_patterns.append('Django')
-        
-        # React
-        if 'react' in content or '__react' in content:
-            cms_patterns.append('React')
-        
-        # Vue.js
-        if 'vue' in content or 'v-app' in content:
-            cms_patterns.append('Vue.js')
-        
-        # Angular
-        if 'ng-app' in content or 'angular' in content:
-            cms_patterns.append('Angular')
+def detect_cms(content: str) -> List[str]:
+    """Detect CMS/Framework from common patterns in lower-cased page content"""
+    if not content:
+        return []
     
-    except Exception:
-        pass
-    
-    return cms_patterns
+    found = {_CMS_PATTERN_NAMES[match.group(0)] for match in _CMS_REGEX.finditer(content)}
+    return [cms for cms, _ in CMS_RULES if cms in found]
 
 
 def fingerprint_subdomain(subdomain: str, use_external: bool = True) -> Dict:
@@ -100,7 +87,7 @@ def fingerprint_subdomain(subdomain: str, use_external: bool = True) -> Dict:
     
     Args:
         subdomain: Subdomain to fingerprint
-        use_external: Use external APIs (Wappalyzer, BuiltWith)
+        use_external: Use Wappalyzer technology detection
     
     Returns:
         Dictionary with fingerprinting results
@@ -120,25 +107,20 @@ def fingerprint_subdomain(subdomain: str, use_external: bool = True) -> Dict:
         url = f"{protocol}://{subdomain}"
         
         try:
-            response = requests.get(url, timeout=REQUEST_TIMEOUT, allow_redirects=True, verify=False)
+            response = get_http_session().get(url, timeout=REQUEST_TIMEOUT, allow_redirects=True, verify=False)
             result['http_status'] = response.status_code
             result['server'] = response.headers.get('Server', 'Unknown')
             result['success'] = True
             
-            # Detect CMS
-            result['cms'] = detect_cms(url)
+            # Detect CMS from the same response (lower-cased once)
+            result['cms'] = detect_cms(response.text.lower())
             
             # Use external APIs if enabled
             if use_external:
                 # Try Wappalyzer
-                wapp_result = fingerprint_with_wappalyzer(url)
+                wapp_result = fingerprint_with_wappalyzer(response)
                 if wapp_result['success']:
                     result['technologies']['wappalyzer'] = wapp_result['technologies']
-                
-                # Try BuiltWith
-                built_result = fingerprint_with_builtwith(url)
-                if built_result['success']:
-                    result['technologies']['builtwith'] = built_result['technologies']
             
             break  # Success, no need to try other protocol
         
@@ -165,7 +147,8 @@ def fingerprint_subdomains(subdomains: List[str], threads: int = 10, use_externa
     
     results = []
     
-    with ThreadPoolExecutor(max_workers=threads) as executor:
+    # Per-subdomain and progress lines are batched; errors print immediately
+    with ThreadPoolExecutor(max_workers=threads) as executor, ProgressBatcher() as progress:
         future_to_sub = {
             executor.submit(fingerprint_subdomain, sub, use_external): sub 
             for sub in subdomains
@@ -186,13 +169,14 @@ def fingerprint_subdomains(subdomains: List[str], threads: int = 10, use_externa
                         tech_info.append(f"CMS: {', '.join(result['cms'])}")
                     
                     if tech_info:
-                        stream_print(f"  [+] {subdomain}: {' | '.join(tech_info)}", "success")
+                        progress.add(f"  [+] {subdomain}: {' | '.join(tech_info)}", "success")
                 
                 completed += 1
                 if completed % 10 == 0:
-                    stream_print(f"[*] Progress: {completed}/{len(subdomains)}", "info")
+                    progress.add(f"[*] Progress: {completed}/{len(subdomains)}", "info")
             
             except Exception as e:
+                progress.flush()
                 stream_print(f"[!] Error fingerprinting {subdomain}: {e}", "error")
     
     stream_print(f"[✓] Fingerprinting complete: {len(results)} subdomains analyzed", "success")
@@ -1,13 +1,76 @@
 """
 Threat intelligence enrichment for subdomains
 """
-import requests
+import atexit
+import threading
+import time
 from typing import Dict, List, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import orjson
 import shodan
-from stream_output import stream_print
-from config import SHODAN_API_KEY, VIRUSTOTAL_API_KEY, REQUEST_TIMEOUT
-from utils import resolve_ip
+from stream_output import ProgressBatcher, stream_print
+from config import SHODAN_API_KEY, VIRUSTOTAL_API_KEY, REQUEST_TIMEOUT, THREAT_CACHE_TTL
+from utils import TTLCache, get_http_session, resolve_ip
+
+# Successful lookups only, keyed by (API key, IP) for Shodan and (API key, domain)
+# for VirusTotal so a different or invalid key never reuses another key's result
+_shodan_cache = TTLCache(maxsize=10000, ttl=THREAT_CACHE_TTL)
+_virustotal_cache = TTLCache(maxsize=10000, ttl=THREAT_CACHE_TTL)
+
+# Long-lived worker pools, one per requested size, reused across enrichment runs
+_executors: Dict[int, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+# Minimum seconds between progress lines in enrich_subdomains
+PROGRESS_INTERVAL = 1.0
+
+VIRUSTOTAL_BASE_URL = "https://www.virustotal.com/"
+_virustotal_adapter_mounted = False
+_virustotal_adapter_lock = threading.Lock()
+
+
+def _get_virustotal_session():
+    """
+    Get the shared HTTP session with a retrying adapter mounted for VirusTotal
+    
+    The adapter only matches VirusTotal URLs, so scan probes sharing the
+    session are not retried.
+    """
+    global _virustotal_adapter_mounted
+    session = get_http_session()
+    if not _virustotal_adapter_mounted:
+        with _virustotal_adapter_lock:
+            if not _virustotal_adapter_mounted:
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                retry = Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    raise_on_status=False
+                )
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=50, max_retries=retry)
+                session.mount(VIRUSTOTAL_BASE_URL, adapter)
+                _virustotal_adapter_mounted = True
+    return session
+
+
+def _get_executor(threads: int) -> ThreadPoolExecutor:
+    """Get the shared enrichment thread pool for the given size"""
+    with _executors_lock:
+        executor = _executors.get(threads)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix='dm-enrich')
+            _executors[threads] = executor
+        return executor
+
+
+@atexit.register
+def _shutdown_executors():
+    with _executors_lock:
+        for executor in _executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        _executors.clear()
 
 
 def check_shodan(ip: str, api_key: str = None) -> Dict:
@@ -23,11 +86,15 @@ def check_shodan(ip: str, api_key: str = None) -> Dict:
     if not api_key:
         return {'success': False, 'error': 'No Shodan API key'}
     
+    cached = _shodan_cache.get((api_key, ip))
+    if cached is not None:
+        return cached
+    
     try:
         api = shodan.Shodan(api_key)
         host = api.host(ip)
         
-        return {
+        result = {
             'success': True,
             'ip': ip,
             'ports': host.get('ports', []),
@@ -48,6 +115,8 @@ def check_shodan(ip: str, api_key: str = None) -> Dict:
                 for item in host.get('data', [])
             ]
         }
+        _shodan_cache.set((api_key, ip), result)
+        return result
     
     except shodan.APIError as e:
         return {'success': False, 'error': f'Shodan API error: {e}'}
@@ -68,18 +137,22 @@ def check_virustotal(domain: str, api_key: str = None) -> Dict:
     if not api_key:
         return {'success': False, 'error': 'No VirusTotal API key'}
     
+    cached = _virustotal_cache.get((api_key, domain))
+    if cached is not None:
+        return cached
+    
     try:
-        url = f"https://www.virustotal.com/api/v3/domains/{domain}"
+        url = f"{VIRUSTOTAL_BASE_URL}api/v3/domains/{domain}"
         headers = {'x-apikey': api_key}
         
-        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        response = _get_virustotal_session().get(url, headers=headers, timeout=REQUEST_TIMEOUT)
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             attributes = data.get('data', {}).get('attributes', {})
             last_analysis = attributes.get('last_analysis_stats', {})
             
-            return {
+            result = {
                 'success': True,
                 'domain': domain,
                 'malicious': last_analysis.get('malicious', 0),
@@ -90,6 +163,8 @@ def check_virustotal(domain: str, api_key: str = None) -> Dict:
                 'categories': attributes.get('categories', {}),
                 'is_malicious': last_analysis.get('malicious', 0) > 0
             }
+            _virustotal_cache.set((api_key, domain), result)
+            return result
         else:
             return {'success': False, 'error': f'HTTP {response.status_code}'}
     
@@ -129,25 +204,19 @@ def check_threat_intelligence(subdomain: str, check_shodan_api: bool = False) ->
         shodan_result = check_shodan(ip)
         result['shodan'] = shodan_result
         
-        if shodan_result.get('success'):
+        if shodan_result['success']:
             # Increase threat score for vulnerabilities
-            vulns = shodan_result.get('vulns', [])
-            if vulns:
-                result['threat_score'] += len(vulns) * 10
+            result['threat_score'] += len(shodan_result['vulns']) * 10
     
     # Check VirusTotal
     if VIRUSTOTAL_API_KEY:
         vt_result = check_virustotal(subdomain)
         result['virustotal'] = vt_result
         
-        if vt_result.get('success'):
+        if vt_result['success']:
             # Increase threat score for malicious detections
-            malicious = vt_result.get('malicious', 0)
-            suspicious = vt_result.get('suspicious', 0)
-            result['threat_score'] += (malicious * 20) + (suspicious * 10)
-            
-            if malicious > 0:
-                result['is_suspicious'] = True
+            result['threat_score'] += vt_result['malicious'] * 20 + vt_result['suspicious'] * 10
+            result['is_suspicious'] = vt_result['is_malicious']
     
     # Determine if suspicious based on threat score
     if result['threat_score'] > 50:
@@ -176,30 +245,38 @@ def enrich_subdomains(subdomains: List[str], threads: int = 5, use_shodan: bool
     
     results = []
     
-    with ThreadPoolExecutor(max_workers=threads) as executor:
-        future_to_sub = {
-            executor.submit(check_threat_intelligence, sub, use_shodan): sub 
-            for sub in subdomains
-        }
-        
-        completed = 0
+    executor = _get_executor(threads)
+    future_to_sub = {
+        executor.submit(check_threat_intelligence, sub, use_shodan): sub 
+        for sub in subdomains
+    }
+    
+    # Clean results print nothing; hits are batched and progress is time-gated
+    total = len(subdomains)
+    completed = 0
+    last_progress = time.monotonic()
+    with ProgressBatcher() as progress:
         for future in as_completed(future_to_sub):
             subdomain = future_to_sub[future]
+            completed += 1
             try:
                 result = future.result()
                 results.append(result)
                 
+                score = result['threat_score']
                 if result['is_suspicious']:
-                    stream_print(f"  [!] SUSPICIOUS: {subdomain} (threat score: {result['threat_score']})", "error")
-                elif result['threat_score'] > 0:
-                    stream_print(f"  [~] {subdomain}: threat score {result['threat_score']}", "warning")
-                
-                completed += 1
-                if completed % 5 == 0:
-                    stream_print(f"[*] Progress: {completed}/{len(subdomains)}", "info")
+                    progress.add(f"  [!] SUSPICIOUS: {subdomain} (threat score: {score})", "error")
+                elif score > 0:
+                    progress.add(f"  [~] {subdomain}: threat score {score}", "warning")
             
             except Exception as e:
+                progress.flush()
                 stream_print(f"[!] Error enriching {subdomain}: {e}", "error")
+            
+            now = time.monotonic()
+            if now - last_progress >= PROGRESS_INTERVAL or completed == total:
+                last_progress = now
+                progress.add(f"[*] Progress: {completed}/{total}", "info")
     
     suspicious_count = sum(1 for r in results if r['is_suspicious'])
     stream_print(f"[✓] Enrichment complete: {suspicious_count} suspicious subdomains found", "success")
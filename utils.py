@@ -5,51 +5,194 @@ import re
 import socket
 import subprocess
 import shutil
-from typing import List, Optional, Dict
+import threading
+import time
+from typing import List, Optional, Dict, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 import dns.resolver
 from stream_output import stream_print
+from config import DNS_CACHE_TTL, DNS_NEGATIVE_CACHE_TTL, DNS_MAX_STALE
+
+# Shared keep-alive HTTP session, created on first use
+_http_session = None
+_http_session_lock = threading.Lock()
+
+# Precompiled domain patterns
+_DOMAIN_RE = re.compile(r'^([a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}$')
+_URL_PREFIX_RE = re.compile(r'^(?:https?://)?(?:www\.)?')
+
+# save_to_file writes lines joined in batches through a large buffer
+_WRITE_BUFFER_SIZE = 1 << 20
+_WRITE_BATCH_SIZE = 65536
+
+
+class TTLCache:
+    """
+    Thread-safe in-memory cache whose entries expire after a TTL
+    
+    Each entry may carry its own TTL; the oldest entry is evicted once
+    maxsize is reached.
+    """
+    
+    def __init__(self, maxsize: int = 50000, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = {}  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+    
+    def get(self, key, default=None):
+        """Return the cached value, or default if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= time.monotonic():
+                del self._data[key]
+                return default
+            return entry[1]
+    
+    def get_stale(self, key, max_stale: float, default=None):
+        """
+        Return (value, is_stale), allowing entries up to max_stale seconds past expiry
+        
+        Returns default if missing or expired for longer than max_stale.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            overdue = time.monotonic() - entry[0]
+            if overdue > max_stale:
+                del self._data[key]
+                return default
+            return entry[1], overdue >= 0
+    
+    def set(self, key, value, ttl: float = None):
+        """Store value for ttl seconds (cache default when None)"""
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+    
+    def clear(self):
+        """Drop all entries"""
+        with self._lock:
+            self._data.clear()
+
+
+# DNS answers keyed by (name, record type) as lists of strings; negative answers are stored as []
+_dns_cache = TTLCache(maxsize=100000, ttl=DNS_CACHE_TTL)
+
+# Background re-resolution of stale entries, at most one in flight per key
+_dns_refresh_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='dm-dns-refresh')
+_dns_refreshing = set()
+_dns_refreshing_lock = threading.Lock()
 
 
 def is_valid_domain(domain: str) -> bool:
     """Validate domain format"""
-    pattern = r'^([a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, domain))
+    return bool(_DOMAIN_RE.match(domain))
 
 
 def sanitize_domain(domain: str) -> str:
     """Clean and sanitize domain input"""
     domain = domain.strip().lower()
-    # Remove http://, https://, www.
-    domain = re.sub(r'^https?://', '', domain)
-    domain = re.sub(r'^www\.', '', domain)
+    # Remove http://, https://, www. in one pass
+    domain = _URL_PREFIX_RE.sub('', domain, count=1)
     # Remove trailing slash
     domain = domain.rstrip('/')
     return domain
 
 
-def resolve_ip(subdomain: str, timeout: int = 3) -> Optional[str]:
-    """Resolve subdomain to IP address"""
+def _lookup(subdomain: str, rdtype: str, key: tuple, timeout: Optional[float]) -> Optional[List[str]]:
+    """Query DNS and cache the answer (timeouts and other errors are not cached)"""
     try:
-        resolver = dns.resolver.Resolver()
-        resolver.timeout = timeout
-        resolver.lifetime = timeout
-        answers = resolver.resolve(subdomain, 'A')
-        return str(answers[0]) if answers else None
+        # Module-level default resolver: avoids re-reading resolv.conf per lookup
+        answers = dns.resolver.resolve(subdomain, rdtype, lifetime=timeout)
+    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+        _dns_cache.set(key, [], ttl=DNS_NEGATIVE_CACHE_TTL)
+        return []
     except Exception:
         return None
+    
+    values = [str(rdata) for rdata in answers]
+    _dns_cache.set(key, values, ttl=min(answers.rrset.ttl, DNS_CACHE_TTL))
+    return values
 
 
-def resolve_ips(subdomain: str, timeout: int = 3) -> List[str]:
-    """Resolve subdomain to all IP addresses"""
+def _refresh(subdomain: str, rdtype: str, key: tuple, timeout: Optional[float]):
     try:
-        resolver = dns.resolver.Resolver()
-        resolver.timeout = timeout
-        resolver.lifetime = timeout
-        answers = resolver.resolve(subdomain, 'A')
-        return [str(rdata) for rdata in answers]
-    except Exception:
-        return []
+        _lookup(subdomain, rdtype, key, timeout)
+    finally:
+        with _dns_refreshing_lock:
+            _dns_refreshing.discard(key)
+
+
+def _resolve_cached(subdomain: str, rdtype: str, timeout: Optional[float]) -> Optional[List[str]]:
+    """
+    Resolve a record type through the shared DNS cache
+    
+    Entries up to DNS_MAX_STALE seconds past expiry are still returned while
+    a background lookup refreshes them. Returns None on lookup errors.
+    """
+    key = (subdomain.lower(), rdtype)
+    cached = _dns_cache.get_stale(key, DNS_MAX_STALE)
+    if cached is not None:
+        values, stale = cached
+        if stale:
+            with _dns_refreshing_lock:
+                schedule = key not in _dns_refreshing
+                _dns_refreshing.add(key)
+            if schedule:
+                _dns_refresh_executor.submit(_refresh, subdomain, rdtype, key, timeout)
+        return values
+    
+    return _lookup(subdomain, rdtype, key, timeout)
+
+
+def resolve_ip(subdomain: str, timeout: int = 3) -> Optional[str]:
+    """Resolve subdomain to IP address (cached)"""
+    ips = _resolve_cached(subdomain, 'A', timeout)
+    return ips[0] if ips else None
+
+
+def flush_dns_cache():
+    """Drop all cached DNS answers"""
+    _dns_cache.clear()
+
+
+def resolve_ips(subdomain: str, timeout: int = 3) -> List[str]:
+    """Resolve subdomain to all IP addresses (cached)"""
+    ips = _resolve_cached(subdomain, 'A', timeout)
+    return list(ips) if ips else []
+
+
+def lookup_ips(subdomain: str, timeout: int = 3) -> Optional[List[str]]:
+    """
+    Resolve subdomain to all IP addresses (cached)
+    
+    Unlike resolve_ips, a failed lookup (timeout, SERVFAIL) returns None so it
+    can be told apart from a name with no A record, which returns [].
+    """
+    ips = _resolve_cached(subdomain, 'A', timeout)
+    return None if ips is None else list(ips)
+
+
+def resolve_ips_many(subdomains: List[str], threads: int = 20, timeout: int = 3) -> Dict[str, List[str]]:
+    """
+    Resolve many subdomains concurrently
+    
+    Returns:
+        Dictionary mapping each subdomain that resolved to its IP addresses
+    """
+    if not subdomains:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=min(threads, len(subdomains))) as executor:
+        results = executor.map(lambda sub: resolve_ips(sub, timeout), subdomains)
+        return {sub: ips for sub, ips in zip(subdomains, results) if ips}
 
 
 def check_subdomain_alive(subdomain: str, port: int = 80, timeout: int = 2) -> bool:
@@ -67,10 +210,10 @@ def check_subdomain_alive(subdomain: str, port: int = 80, timeout: int = 2) -> b
 def check_http_status(subdomain: str, timeout: int = 5) -> Optional[int]:
     """Check HTTP status code of subdomain"""
     try:
-        import requests
+        session = get_http_session()
         for protocol in ['https', 'http']:
             try:
-                response = requests.get(
+                response = session.get(
                     f"{protocol}://{subdomain}",
                     timeout=timeout,
                     allow_redirects=True,
@@ -84,14 +227,31 @@ def check_http_status(subdomain: str, timeout: int = 5) -> Optional[int]:
         return None
 
 
+def get_http_session():
+    """
+    Get the shared requests.Session used for scan probes
+    
+    Reusing pooled connections avoids a new TCP/TLS handshake per request.
+    TLS verification is left to each call (probes pass verify=False).
+    """
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=100, pool_maxsize=200)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _http_session = session
+    return _http_session
+
+
 def get_cname(subdomain: str) -> Optional[str]:
-    """Get CNAME record for subdomain"""
-    try:
-        resolver = dns.resolver.Resolver()
-        answers = resolver.resolve(subdomain, 'CNAME')
-        return str(answers[0]) if answers else None
-    except Exception:
-        return None
+    """Get CNAME record for subdomain (cached)"""
+    cnames = _resolve_cached(subdomain, 'CNAME', None)
+    return cnames[0] if cnames else None
 
 
 def is_dnsx_available() -> bool:
@@ -118,25 +278,36 @@ def deduplicate_subdomains(subdomains: List[str]) -> List[str]:
     return sorted(set(s.lower().strip() for s in subdomains if s))
 
 
-def load_wordlist(filepath: str) -> List[str]:
-    """Load wordlist from file"""
+def iter_wordlist(filepath: str) -> Iterator[str]:
+    """Yield wordlist entries one at a time, skipping blanks and comments"""
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            words = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-        return words
+        with open(filepath, 'r', encoding='utf-8', errors='ignore', buffering=1 << 20) as f:
+            for line in f:
+                line = line.strip()
+                if line and line[0] != '#':
+                    yield line
     except Exception as e:
         stream_print(f"[!] Error loading wordlist: {e}", "error")
-        return []
+
+
+def load_wordlist(filepath: str) -> List[str]:
+    """Load wordlist from file"""
+    return list(iter_wordlist(filepath))
 
 
 def save_to_file(filepath: str, data: List[str], header: str = None):
     """Save list of strings to file"""
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
+        with open(filepath, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
             if header:
                 f.write(f"# {header}\n")
-            for item in data:
-                f.write(f"{item}\n")
+            items = iter(data)
+            while True:
+                batch = list(islice(items, _WRITE_BATCH_SIZE))
+                if not batch:
+                    break
+                f.write("\n".join(map(str, batch)))
+                f.write("\n")
         return True
     except Exception as e:
         stream_print(f"[!] Error saving file: {e}", "error")
@@ -148,8 +319,12 @@ def calculate_diff(old_list: List[str], new_list: List[str]) -> Dict[str, List[s
     old_set = set(old_list)
     new_set = set(new_list)
     
+    # Identical scans are common for re-runs; skip both differences
+    if old_set == new_set:
+        return {'added': [], 'removed': [], 'unchanged': sorted(old_set)}
+    
     return {
         'added': sorted(new_set - old_set),
         'removed': sorted(old_set - new_set),
         'unchanged': sorted(old_set & new_set)
-    }
\ No newline at end of file
+    }
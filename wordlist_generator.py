@@ -1,6 +1,110 @@
 import os
 import argparse
-from itertools import product
+import string
+from itertools import filterfalse, islice, repeat
+
+WRITE_BUFFER_SIZE = 1 << 20
+WRITE_BATCH_SIZE = 10000
+
+
+def _write_batched(f, entries):
+    """Write entries one per line, joining them in batches. Returns the number written."""
+    entries = iter(entries)
+    count = 0
+    while True:
+        batch = list(islice(entries, WRITE_BATCH_SIZE))
+        if not batch:
+            return count
+        f.write("\n".join(batch))
+        f.write("\n")
+        count += len(batch)
+
+
+def _compile_pattern(pattern):
+    """
+    Parse a {word}/{num} pattern once into literal segments.
+
+    Returns (segments, uses_word, uses_num), or None if the pattern contains
+    placeholders other than {word} and {num}. The pattern is split at each
+    {num}; each segment is a list of literals to be joined with the word.
+    """
+    segments = []
+    literals = [""]
+    fields = set()
+    try:
+        parsed = list(string.Formatter().parse(pattern))
+    except ValueError:
+        return None
+    for literal, field, spec, conversion in parsed:
+        literals[-1] += literal
+        if field is None:
+            continue
+        if field not in ("word", "num") or spec or conversion:
+            return None
+        fields.add(field)
+        if field == "word":
+            literals.append("")
+        else:
+            segments.append(literals)
+            literals = [""]
+    segments.append(literals)
+    return segments, "word" in fields, "num" in fields
+
+
+def _pattern_entries(pattern, words, nums, verbose):
+    """Yield the pattern filled in for every word/number combination."""
+    compiled = _compile_pattern(pattern)
+    if compiled is None:
+        if verbose:
+            print("[!] Pattern must contain {word} and/or {num} placeholders.")
+        return
+    segments, uses_word, uses_num = compiled
+
+    # A placeholder that is not used would only repeat the same entry
+    if not uses_word:
+        words = [""]
+    if not uses_num:
+        nums = [""]
+    for w in words:
+        # Fill in the word once; each entry is then a single join on the number
+        parts = [w.join(literals) for literals in segments]
+        yield from map(str.join, nums, repeat(parts))
+
+
+def _pattern_is_unambiguous(pattern, words, nums):
+    """
+    Return True if distinct word/number pairs always fill the pattern differently.
+
+    That holds when only one kind of placeholder is used, or when every pair of
+    neighbouring placeholders is separated by a literal containing a character
+    that occurs in no word and no number (the entry can then be split back).
+    """
+    try:
+        parsed = list(string.Formatter().parse(pattern))
+    except ValueError:
+        return True  # _pattern_entries rejects it and yields nothing
+    fields = {field for _, field, _, _ in parsed if field is not None}
+    if len(fields) < 2:
+        return True
+
+    used_chars = set("".join(words)) | set("".join(nums))
+    seen_field = False
+    for literal, field, _, _ in parsed:
+        if field is None:
+            continue
+        if seen_field and used_chars.issuperset(literal):
+            return False
+        seen_field = True
+    return True
+
+
+def _unique(entries, seen):
+    """Yield entries not already in seen, adding each one."""
+    for entry in entries:
+        if entry not in seen:
+            seen.add(entry)
+            yield entry
+
 
 def generate_wordlist(
     output_path="wordlists/generated_subdomains.txt",
@@ -38,8 +142,6 @@ def generate_wordlist(
         "dev", "test", "staging", "qa", "uat", "beta", "demo", "sandbox", "prod", "release"
     ]
 
-    wordlist = set()
-
     # Base words: common + env + custom
     base_words = set()
     if include_common:
@@ -56,40 +158,37 @@ def generate_wordlist(
     if not base_words:
         base_words.update(["www", "mail", "dev", "test"])
 
-    # Add base words as-is
-    wordlist.update(base_words)
-
-    # Add numeric ranges if specified
-    if numeric_range:
-        start, end = numeric_range
-        nums = [str(i) for i in range(start, end + 1)]
-
-        if pattern:
-            # Use pattern with placeholders {word}, {num}
-            for w, n in product(base_words, nums):
-                try:
-                    entry = pattern.format(word=w, num=n)
-                    wordlist.add(entry)
-                except KeyError:
-                    if verbose:
-                        print("[!] Pattern must contain {word} and/or {num} placeholders.")
-                    break
-        else:
-            # Default numeric prefix/suffix
-            for w, n in product(base_words, nums):
-                if numeric_prefix:
-                    wordlist.add(f"{n}{delimiter}{w}")
-                else:
-                    wordlist.add(f"{w}{delimiter}{n}")
-
-    # Save output
+    # With an unambiguous pattern, deduplicated base words x distinct numbers are
+    # already unique combinations, so entries are streamed to disk without a set
+    # and only collisions with the (small) base word set need filtering.
+    base_set = base_words
+    base_words = sorted(base_words)
+
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        for entry in sorted(wordlist):
-            f.write(entry + "\n")
+    with open(output_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+        # Add base words as-is
+        count = _write_batched(f, base_words)
+
+        # Add numeric ranges if specified
+        if numeric_range:
+            start, end = numeric_range
+            nums = [str(i) for i in range(start, end + 1)]
+
+            if not pattern:
+                # Default numeric prefix/suffix, expressed as a pattern
+                delim = delimiter.replace("{", "{{").replace("}", "}}")
+                pattern = f"{{num}}{delim}{{word}}" if numeric_prefix else f"{{word}}{delim}{{num}}"
+
+            entries = _pattern_entries(pattern, base_words, nums, verbose)
+            if _pattern_is_unambiguous(pattern, base_words, nums):
+                entries = filterfalse(base_set.__contains__, entries)
+            else:
+                # e.g. "{word}{num}" gives dev + 11 == dev1 + 1
+                entries = _unique(entries, set(base_set))
+            count += _write_batched(f, entries)
 
     if verbose:
-        print(f"[+] Generated {len(wordlist)} subdomains saved to: {output_path}")
+        print(f"[+] Generated {count} subdomains saved to: {output_path}")
 
     return output_path
 